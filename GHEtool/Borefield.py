@@ -1344,11 +1344,12 @@ class Borefield(BaseClass):
             New depth of the borefield [m]
         """
         # diff between the max temperature in peak injection and the avg undisturbed ground temperature at current_depth
-        delta_temp = np.max(self.results.peak_injection - self.ground_data.calculate_Tg(current_depth))
+        Tg = self.ground_data.calculate_Tg(current_depth)
+        delta_temp = np.max(self.results.peak_injection - Tg)
 
         # calculate the maximum temperature difference between the temperature limit and the ground temperature
         # at current_depth
-        delta_wrt_max = self.Tf_max - self.ground_data.calculate_Tg(current_depth)
+        delta_wrt_max = self.Tf_max - Tg
 
         # delta_t1/H1 ~ delta_t2/H2
         # H2 = delta_t2/delta_t1*current_depth
@@ -1400,36 +1401,38 @@ class Borefield(BaseClass):
                 self._calculate_temperature_profile(self.H, hourly=False)
             H_prev = self.H
             if not deep_sizing:
+                # ground temperature at the current depth, evaluated once per iteration
+                Tg = self._Tg(H_prev)
                 if quadrant == 1:
                     # maximum temperature
                     # convert back to required length
-                    self.H = (np.max(self.results.peak_injection[: 8760 if hourly else 12]) - self._Tg()) / (
-                            self.Tf_max - self._Tg()) * H_prev
+                    self.H = (np.max(self.results.peak_injection[: 8760 if hourly else 12]) - Tg) / (
+                            self.Tf_max - Tg) * H_prev
                 elif quadrant == 2:
                     # maximum temperature
                     # convert back to required length
-                    self.H = (np.max(self.results.peak_injection[-8760 if hourly else -12:]) - self._Tg()) / (
-                            self.Tf_max - self._Tg()) * H_prev
+                    self.H = (np.max(self.results.peak_injection[-8760 if hourly else -12:]) - Tg) / (
+                            self.Tf_max - Tg) * H_prev
                 elif quadrant == 3:
                     # minimum temperature
                     # convert back to required length
-                    self.H = (np.min(self.results.peak_extraction[: 8760 if hourly else 12]) - self._Tg()) / (
-                            self.Tf_min - self._Tg()) * H_prev
+                    self.H = (np.min(self.results.peak_extraction[: 8760 if hourly else 12]) - Tg) / (
+                            self.Tf_min - Tg) * H_prev
                 elif quadrant == 4:
                     # minimum temperature
                     # convert back to required length
-                    self.H = (np.min(self.results.peak_extraction[-8760 if hourly else -12:]) - self._Tg()) / (
-                            self.Tf_min - self._Tg()) * H_prev
+                    self.H = (np.min(self.results.peak_extraction[-8760 if hourly else -12:]) - Tg) / (
+                            self.Tf_min - Tg) * H_prev
                 elif quadrant == 10:
                     # over all years
                     # maximum temperature
                     # convert back to required length
-                    self.H = (np.max(self.results.peak_injection) - self._Tg()) / (self.Tf_max - self._Tg()) * H_prev
+                    self.H = (np.max(self.results.peak_injection) - Tg) / (self.Tf_max - Tg) * H_prev
                 elif quadrant == 20:
                     # over all years
                     # minimum temperature
                     # convert back to required length
-                    self.H = (np.min(self.results.peak_extraction) - self._Tg()) / (self.Tf_min - self._Tg()) * H_prev
+                    self.H = (np.min(self.results.peak_extraction) - Tg) / (self.Tf_min - Tg) * H_prev
             elif self.ground_data.variable_Tg:
                 # for when the temperature gradient is active and it is injection
                 self.H = self.calculate_next_depth_deep_sizing(H_prev)
@@ -227,11 +227,15 @@ def optimise_load_profile_energy(
     heating_peak_bl = np.zeros((nb_points, 12 * building_load.simulation_period))
     cooling_peak_bl = np.zeros((nb_points, 12 * building_load.simulation_period))
 
+    # the hourly loads are fetched once and every clipped profile is written into the same scratch array
+    hourly_heating = building_load.hourly_heating_load_simulation_period
+    hourly_cooling = building_load.hourly_cooling_load_simulation_period
+    clipped_load = np.empty(hourly_heating.shape)
     for idx in range(nb_points):
-        heating_peak_bl[idx] = building_load.resample_to_monthly(
-            np.minimum(power_heating_range[idx], building_load.hourly_heating_load_simulation_period))[1]
-        cooling_peak_bl[idx] = building_load.resample_to_monthly(
-            np.minimum(power_cooling_range[idx], building_load.hourly_cooling_load_simulation_period))[1]
+        np.minimum(power_heating_range[idx], hourly_heating, out=clipped_load)
+        heating_peak_bl[idx] = building_load.resample_to_monthly(clipped_load)[1]
+        np.minimum(power_cooling_range[idx], hourly_cooling, out=clipped_load)
+        cooling_peak_bl[idx] = building_load.resample_to_monthly(clipped_load)[1]
 
     # create monthly multi-load
     monthly_load = \
@@ -307,14 +311,8 @@ def optimise_load_profile_energy(
         np.ndarray
             New array with hourly values where each value is the minimum of the monthly and hourly array
         """
-        new_load = np.zeros_like(hourly_load)
-        UPM = np.cumsum(np.tile(building_load.UPM, building_load.simulation_period))
-        month_idx = 0
-        for idx, val in enumerate(hourly_load):
-            if idx == UPM[month_idx] and not month_idx == len(UPM) - 1:
-                month_idx += 1
-            new_load[idx] = min(val, monthly_peak[month_idx])
-        return new_load
+        hours_per_month = np.tile(building_load.UPM, building_load.simulation_period)
+        return np.minimum(hourly_load, np.repeat(monthly_peak, hours_per_month))
 
     # calculate hourly load
     borefield_load = copy.deepcopy(building_load)
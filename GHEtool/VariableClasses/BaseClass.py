@@ -33,7 +33,7 @@ class BaseClass:
         """
         # get all variables in class
         if hasattr(self, "__slots__"):
-            variables: List[str] = list(self.__slots__)
+            variables: List[str] = self._all_slots()
         else:
             variables: List[str] = [attr for attr in dir(self) if not callable(getattr(self, attr)) and not attr.startswith("__")]
 
@@ -43,6 +43,19 @@ class BaseClass:
         else:
             return False
 
+    @classmethod
+    def _all_slots(cls) -> List[str]:
+        """
+        This function returns the slots of the class together with the slots of its parent classes,
+        since a subclass only declares the slots it adds.
+
+        Returns
+        -------
+        List[str]
+            Names of all the slots
+        """
+        return [slot for klass in reversed(cls.__mro__) for slot in klass.__dict__.get("__slots__", ())]
+
 
 class UnsolvableDueToTemperatureGradient(Exception):
     """
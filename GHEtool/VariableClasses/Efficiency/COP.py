@@ -110,10 +110,9 @@ class COP(_Efficiency):
 
         cop_array = self.get_COP(primary_temperature, secondary_temperature, power)
 
-        # SCOP = sum(Q)/sum(W)
-        w_array = np.array(power) / cop_array
-
-        return np.sum(power) / np.sum(w_array)
+        # SCOP = sum(Q)/sum(W), the electrical power W = Q/COP is written over the freshly interpolated COPs
+        power = np.asarray(power)
+        return np.sum(power) / np.sum(np.divide(power, cop_array, out=cop_array))
 
     def __repr__(self):
         if self._has_part_load:
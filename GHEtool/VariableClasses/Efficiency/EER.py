@@ -111,10 +111,9 @@ class EER(_Efficiency):
 
         eer_array = self.get_EER(primary_temperature, secondary_temperature, power)
 
-        # SEER = sum(Q)/sum(W)
-        w_array = np.array(power) / eer_array
-
-        return np.sum(power) / np.sum(w_array)
+        # SEER = sum(Q)/sum(W), the electrical power W = Q/EER is written over the freshly interpolated EERs
+        power = np.asarray(power)
+        return np.sum(power) / np.sum(np.divide(power, eer_array, out=eer_array))
 
     def __repr__(self):
         if self._has_part_load:
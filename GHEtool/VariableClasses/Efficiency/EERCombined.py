@@ -137,7 +137,7 @@ class EERCombined:
         passive_cooling_eer = self.efficiency_passive_cooling.get_EER(primary_temperature, secondary_temperature, power)
 
         if month_indices is not None and isinstance(primary_temperature, (float, int)):
-            primary_temperature = np.full(month_indices.shape, primary_temperature)
+            primary_temperature = np.broadcast_to(primary_temperature, month_indices.shape)
 
         active_cooling_bool = self.get_time_series_active_cooling(primary_temperature, month_indices)
 
@@ -182,9 +182,8 @@ class EERCombined:
         eer_array = self.get_EER(primary_temperature, secondary_temperature, power, month_indices)
 
         # SEER = sum(Q)/sum(W)
-        w_array = np.array(power) / eer_array
-
-        return np.sum(power) / np.sum(w_array)
+        power = np.asarray(power)
+        return np.sum(power) / np.sum(power / eer_array)
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, self.__class__):
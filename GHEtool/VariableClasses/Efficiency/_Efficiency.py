@@ -1,6 +1,6 @@
 import numpy as np
 
-from scipy.interpolate import interpn, interp1d
+from scipy.interpolate import RegularGridInterpolator
 from typing import Union
 
 
@@ -11,18 +11,40 @@ class _EfficiencyBase:
             return False
 
         for key in self.__dict__:
-            value1 = self.__dict__[key]
-            value2 = other.__dict__[key]
-
-            if isinstance(value1, np.ndarray) and isinstance(value2, np.ndarray):
-                if not np.array_equal(value1, value2):
-                    return False
-            else:
-                if not np.array_equal(value1, value2):
-                    return False
+            if key == '_interp':
+                # the interpolator is built from the grid and data, which are compared themselves
+                continue
+            if not self._equal_values(self.__dict__[key], other.__dict__[key]):
+                return False
 
         return True
 
+    @staticmethod
+    def _equal_values(value1, value2) -> bool:
+        """
+        This function checks whether two attribute values are equal.
+        Arrays of a different shape are unequal without an element-wise comparison and lists, like the interpolation
+        points, are compared item by item, since their arrays can have different lengths.
+
+        Parameters
+        ----------
+        value1
+            First attribute value
+        value2
+            Second attribute value
+
+        Returns
+        -------
+        bool
+            True if both values are equal
+        """
+        if isinstance(value1, np.ndarray) and isinstance(value2, np.ndarray):
+            return value1.shape == value2.shape and np.array_equal(value1, value2)
+        if isinstance(value1, list) and isinstance(value2, list):
+            return len(value1) == len(value2) and \
+                all(_EfficiencyBase._equal_values(item1, item2) for item1, item2 in zip(value1, value2))
+        return np.array_equal(value1, value2)
+
 
 class _Efficiency(_EfficiencyBase):
     """
@@ -95,53 +117,27 @@ class _Efficiency(_EfficiencyBase):
                              'Please check the nb_of_points for both secondary temperature and part load.')
 
         # get ranges
-        self._points = []
         if dimensions == 3:
             self._range_primary = np.sort(np.unique(coordinates[:, 0]))
             self._range_secondary = np.sort(np.unique(coordinates[:, 1]))
             self._range_part_load = np.sort(np.unique(coordinates[:, 2]))
-            self._points.append(self._range_secondary)
-            self._points.append(self._range_part_load)
         elif self._has_secondary:
             self._range_primary = np.sort(np.unique(coordinates[:, 0]))
             self._range_secondary = np.sort(np.unique(coordinates[:, 1]))
-            self._points.append(self._range_secondary)
         elif self._has_part_load:
             self._range_primary = np.sort(np.unique(coordinates[:, 0]))
             self._range_part_load = np.sort(np.unique(coordinates[:, 1]))
-            self._points.append(self._range_part_load)
         else:
             self._range_primary = np.sort(coordinates)
-        self._points.insert(0, self._range_primary)
 
         def find_value(x, y, z=None):
+            # the data point does not exist, so we have to interpolate it along the last dimension
             if z is None:
-                index = np.nonzero(np.all(coordinates == (x, y), axis=1))[0]
+                mask = coordinates[:, 0] == x
             else:
-                index = np.nonzero(np.all(coordinates == (x, y, z), axis=1))[0]
-
-            # the data point exists
-            if len(index) > 0:
-                return data[index[0]]
-
-            # the data point does not exist, so we have to interpolate to get it
-            x_array = []
-            y_array = []
-            if z is None:
-                # only one dimension to check
-                for idx, val in enumerate(coordinates):
-                    if val[0] == x:
-                        x_array.append(val[1])
-                        y_array.append(data[idx])
-            else:
-                # two dimensions to check
-                for idx, val in enumerate(coordinates):
-                    if val[0] == x and val[1] == y:
-                        x_array.append(val[2])
-                        y_array.append(data[idx])
-            # as array
-            x_array = np.array(x_array)
-            y_array = np.array(y_array)
+                mask = (coordinates[:, 0] == x) & (coordinates[:, 1] == y)
+            x_array = coordinates[mask, -1]
+            y_array = data[mask]
 
             # sort array
             p = x_array.argsort()
@@ -152,31 +148,36 @@ class _Efficiency(_EfficiencyBase):
             return temp
 
         # populate data matrix
-        if dimensions == 3:
-            self._data = np.empty((len(self._range_primary), len(self._range_secondary), len(self._range_part_load)))
-            for i in range(self._data.shape[0]):
-                for j in range(self._data.shape[1]):
-                    for k in range(self._data.shape[2]):
-                        self._data[i, j, k] = find_value(self._range_primary[i],
-                                                         self._range_secondary[j],
-                                                         self._range_part_load[k])
-        elif dimensions == 2:
-            self._data = np.empty(
-                (len(self._range_primary), max(len(self._range_secondary), len(self._range_part_load))))
+        if dimensions > 1:
+            ranges = [self._range_primary]
             if self._has_secondary:
-                for i in range(self._data.shape[0]):
-                    for j in range(self._data.shape[1]):
-                        self._data[i, j] = find_value(self._range_primary[i],
-                                                      self._range_secondary[j])
-            else:
-                for i in range(self._data.shape[0]):
-                    for j in range(self._data.shape[1]):
-                        self._data[i, j] = find_value(self._range_primary[i],
-                                                      self._range_part_load[j])
+                ranges.append(self._range_secondary)
+            if self._has_part_load:
+                ranges.append(self._range_part_load)
+            self._data = np.full([len(i) for i in ranges], np.nan)
+            # place all the given data points in the grid at once, keeping the first of duplicated coordinates
+            indices = tuple(np.searchsorted(values, coordinates[:, i]) for i, values in enumerate(ranges))
+            flat = np.ravel_multi_index(indices, self._data.shape)
+            _, first = np.unique(flat, return_index=True)
+            self._data.flat[flat[first]] = data[first]
+            # only the grid points that are not in the dataset have to be interpolated
+            for index in zip(*np.nonzero(np.isnan(self._data))):
+                self._data[index] = find_value(*(values[i] for values, i in zip(ranges, index)))
         else:
             p = self._range_primary.argsort()
             self._data = data[p]
 
+        # store the grid and data as contiguous float64 arrays, so they are not converted on every interpolation
+        self._range_primary = np.ascontiguousarray(self._range_primary, dtype=np.float64)
+        self._range_secondary = np.ascontiguousarray(self._range_secondary, dtype=np.float64)
+        self._range_part_load = np.ascontiguousarray(self._range_part_load, dtype=np.float64)
+        self._data = np.ascontiguousarray(self._data, dtype=np.float64)
+        self._points = [self._range_primary]
+        if self._has_secondary:
+            self._points.append(self._range_secondary)
+        if self._has_part_load:
+            self._points.append(self._range_part_load)
+
         # correct for nominal power
         if nominal_power is not None and reference_nominal_power is None:
             raise ValueError('Please enter a reference nominal power.')
@@ -184,6 +185,16 @@ class _Efficiency(_EfficiencyBase):
         if self._has_part_load and nominal_power is not None:
             self._range_part_load *= nominal_power / reference_nominal_power
 
+        # the interpolator is built once, so its grid and data are not checked again on every call
+        if self._has_part_load or self._has_secondary:
+            self._interp = RegularGridInterpolator(self._points, self._data, bounds_error=False, fill_value=np.nan)
+
+        # equal objects have the same float64 data grid (which contains no -0.0 or nan), so it is used for the hash
+        self._hash: int = hash((self._data.shape, self._data.tobytes()))
+
+    def __hash__(self) -> int:
+        return self._hash
+
     def _get_efficiency(self,
                         primary_temperature: Union[float, np.ndarray],
                         secondary_temperature: Union[float, np.ndarray] = None,
@@ -223,14 +234,12 @@ class _Efficiency(_EfficiencyBase):
         _max_length = np.max([len(i) if i is not None and not isinstance(i, (float, int)) else 1 for i in
                               (primary_temperature, secondary_temperature, power)])
 
-        # convert to arrays
-        primary_temperature = np.array(
-            np.full(_max_length, primary_temperature) if isinstance(primary_temperature,
-                                                                    (float, int)) else primary_temperature)
-        secondary_temperature = np.array(
-            np.full(_max_length, secondary_temperature) if isinstance(secondary_temperature,
-                                                                      (float, int)) else secondary_temperature)
-        power = np.array(np.full(_max_length, power) if isinstance(power, (float, int)) else power)
+        # convert to arrays, scalars are broadcast as read-only views since the inputs are only read from below
+        primary_temperature = np.broadcast_to(primary_temperature, _max_length) if isinstance(
+            primary_temperature, (float, int)) else np.asarray(primary_temperature)
+        secondary_temperature = np.broadcast_to(secondary_temperature, _max_length) if isinstance(
+            secondary_temperature, (float, int)) else np.asarray(secondary_temperature)
+        power = np.broadcast_to(power, _max_length) if isinstance(power, (float, int)) else np.asarray(power)
 
         # clip, so that no values fall outside the provided values
         primary_temperature_clipped = np.clip(primary_temperature,
@@ -244,14 +253,19 @@ class _Efficiency(_EfficiencyBase):
         if self._has_part_load:
             part_load_clipped = np.clip(power, np.min(self._range_part_load), np.max(self._range_part_load))
 
+        # the interpolation points are stacked as an (n, ndim) array instead of a list of tuples
         xi = primary_temperature_clipped
         if self._has_part_load and self._has_secondary:
-            xi = list(zip(primary_temperature_clipped, secondary_temperature_clipped, part_load_clipped))
+            xi = np.column_stack((primary_temperature_clipped, secondary_temperature_clipped, part_load_clipped))
         elif self._has_secondary:
-            xi = list(zip(primary_temperature_clipped, secondary_temperature_clipped))
+            xi = np.column_stack((primary_temperature_clipped, secondary_temperature_clipped))
         elif self._has_part_load:
-            xi = list(zip(primary_temperature_clipped, part_load_clipped))
+            xi = np.column_stack((primary_temperature_clipped, part_load_clipped))
 
-        interp = interpn(self._points, self._data, xi, bounds_error=False, fill_value=np.nan)
+        if self._has_part_load or self._has_secondary:
+            interp = self._interp(xi)
+        else:
+            # a 1D dataset is interpolated with np.interp, which avoids the overhead of the N-dimensional interpolator
+            interp = np.interp(xi, self._range_primary, self._data)
         if not np.isnan(interp).any():
             return interp
@@ -2,7 +2,7 @@ from GHEtool.VariableClasses.GroundData._GroundData import _GroundData
 
 
 class GroundConstantTemperature(_GroundData):
-    __slots__ = _GroundData.__slots__
+    __slots__ = ()
 
     def __init__(self, k_s: float = None,
                  T_g: float = None,
@@ -2,7 +2,7 @@ from GHEtool.VariableClasses.GroundData._GroundData import _GroundData
 
 
 class GroundFluxTemperature(_GroundData):
-    __slots__ = _GroundData.__slots__ + ('flux',)
+    __slots__ = 'flux',
 
     def __init__(self, k_s: float = None,
                  T_g: float = None,
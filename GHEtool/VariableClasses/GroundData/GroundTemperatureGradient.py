@@ -2,7 +2,7 @@ from GHEtool.VariableClasses.GroundData._GroundData import _GroundData
 
 
 class GroundTemperatureGradient(_GroundData):
-    __slots__ = _GroundData.__slots__ + ('gradient',)
+    __slots__ = 'gradient',
 
     def __init__(self, k_s: float = None,
                  T_g: float = None,
@@ -59,7 +59,7 @@ class GroundLayer(BaseClass):
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
             return False
-        for i in self.__slots__:
+        for i in self._all_slots():
             if getattr(self, i) != getattr(other, i):
                 return False
         return True
@@ -350,7 +350,7 @@ class _GroundData(BaseClass, ABC):
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
             return False
-        for i in self.__slots__:
+        for i in self._all_slots():
             if getattr(self, i) != getattr(other, i):
                 return False
         return True
@@ -167,12 +167,10 @@ class _HourlyData(_LoadData, ABC):
         peak loads [kW], monthly average loads [kWh/month] : np.ndarray, np.ndarray
         """
 
-        data = np.array_split(hourly_load, np.cumsum(np.tile(self.UPM, int(len(hourly_load) / 8760)))[:-1])
+        # index of the first hour of every month
+        month_start = np.concatenate(([0], np.cumsum(np.tile(self.UPM, int(len(hourly_load) / 8760)))[:-1]))
 
-        if self.all_months_equal:
-            return np.max(data, axis=1), np.sum(data, axis=1)
-
-        return np.array([np.max(i) for i in data]), np.array([np.sum(i) for i in data])
+        return np.maximum.reduceat(hourly_load, month_start), np.add.reduceat(hourly_load, month_start)
 
     @property
     def simulation_period(self) -> int:
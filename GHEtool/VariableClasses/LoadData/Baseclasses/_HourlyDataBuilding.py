@@ -524,11 +524,13 @@ class _HourlyDataBuilding(_LoadDataBuilding, _HourlyData, ABC):
         # TODO implement single column
 
         # import data
-        df = pd.read_csv(file_path, sep=separator, header=header, decimal=decimal_seperator)
+        columns = sorted({col_heating, col_cooling})
+        df = pd.read_csv(file_path, sep=separator, header=header, decimal=decimal_seperator, usecols=columns,
+                         dtype=np.float64)
 
-        # set data
-        self.hourly_heating_load = np.array(df.iloc[:, col_heating])
-        self.hourly_cooling_load = np.array(df.iloc[:, col_cooling])
+        # set data (only the selected columns are parsed, in the order in which they appear in the file)
+        self.hourly_heating_load = df.iloc[:, columns.index(col_heating)].to_numpy()
+        self.hourly_cooling_load = df.iloc[:, columns.index(col_cooling)].to_numpy()
 
     @property
     def max_peak_injection(self) -> float:
@@ -633,25 +633,23 @@ class _LoadData(ABC):
         if not isinstance(load_array, (np.ndarray, list, tuple)):
             ghe_logger.error("The load should be of type np.ndarray, list or tuple.")
             return False
+        length = 8760 if self._hourly else 12
         if self._multiyear:
-            if self._hourly:
-                if not len(load_array) % 8760 == 0:
-                    ghe_logger.error("The length of the load should be a multiple of 8760.")
-                    return False
-            else:
-                if not len(load_array) % 12 == 0:
-                    ghe_logger.error("The length of the load should be a multiple of 12.")
-                    return False
+            if not len(load_array) % length == 0:
+                ghe_logger.error(f"The length of the load should be a multiple of {length}.")
+                return False
+        elif not len(load_array) == length:
+            ghe_logger.error(f"The length of the load should be {length}.")
+            return False
+        # the builtin min avoids converting lists and tuples to an array, and a single year of monthly values
+        # is short enough that it beats a NumPy reduction
+        if not isinstance(load_array, np.ndarray):
+            minimum = min(load_array)
+        elif not self._multiyear and not self._hourly:
+            minimum = min(load_array.flat)
         else:
-            if self._hourly:
-                if not len(load_array) == 8760:
-                    ghe_logger.error("The length of the load should be 8760.")
-                    return False
-            else:
-                if not len(load_array) == 12:
-                    ghe_logger.error("The length of the load should be 12.")
-                    return False
-        if np.min(load_array) < 0:
+            minimum = load_array.min()
+        if minimum < 0:
             ghe_logger.error("No value in the load can be smaller than zero.")
             return False
         return True
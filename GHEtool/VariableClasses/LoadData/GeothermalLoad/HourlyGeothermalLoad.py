@@ -233,11 +233,13 @@ class HourlyGeothermalLoad(_SingleYear, _HourlyData):
         #     ghe_logger.info('Only one column with data selected. Load will be splitted into heating and cooling load.')
 
         # import data
-        df = pd.read_csv(file_path, sep=separator, header=header, decimal=decimal_seperator)
+        columns = sorted({col_extraction, col_injection})
+        df = pd.read_csv(file_path, sep=separator, header=header, decimal=decimal_seperator, usecols=columns,
+                         dtype=np.float64)
 
-        # set data
-        self.hourly_extraction_load = np.array(df.iloc[:, col_extraction])
-        self.hourly_injection_load = np.array(df.iloc[:, col_injection])
+        # set data (only the selected columns are parsed, in the order in which they appear in the file)
+        self.hourly_extraction_load = df.iloc[:, columns.index(col_extraction)].to_numpy()
+        self.hourly_injection_load = df.iloc[:, columns.index(col_injection)].to_numpy()
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, HourlyGeothermalLoad):
@@ -89,10 +89,12 @@ class MonthlyGeothermalLoadAbsolute(_SingleYear, _LoadData):
             When either the length is not 12, the input is not of the correct type, or it contains negative
             values
         """
-        if self._check_input(load):
-            self._baseload_injection = np.array(load)
+        if load is self._baseload_injection:
+            # the stored array was already converted and checked when it was set
             return
-        raise ValueError
+        if not self._check_input(load):
+            raise ValueError("The baseload injection is not valid. Please check the logged error for the cause.")
+        self._baseload_injection = self._float_array(load)
 
     def set_baseload_injection(self, load: ArrayLike) -> None:
         """
@@ -151,10 +153,12 @@ class MonthlyGeothermalLoadAbsolute(_SingleYear, _LoadData):
             When either the length is not 12, the input is not of the correct type, or it contains negative
             values
         """
-        if self._check_input(load):
-            self._baseload_extraction = np.array(load)
+        if load is self._baseload_extraction:
+            # the stored array was already converted and checked when it was set
             return
-        raise ValueError
+        if not self._check_input(load):
+            raise ValueError("The baseload extraction is not valid. Please check the logged error for the cause.")
+        self._baseload_extraction = self._float_array(load)
 
     def set_baseload_extraction(self, load: ArrayLike) -> None:
         """
@@ -177,7 +181,7 @@ class MonthlyGeothermalLoadAbsolute(_SingleYear, _LoadData):
             When either the length is not 12, the input is not of the correct type, or it contains negative
             values
         """
-        self.baseload_extraction = np.array(load)
+        self.baseload_extraction = load
 
     @property
     def peak_injection(self) -> np.ndarray:
@@ -212,10 +216,12 @@ class MonthlyGeothermalLoadAbsolute(_SingleYear, _LoadData):
             When either the length is not 12, the input is not of the correct type, or it contains negative
             values
         """
-        if self._check_input(load):
-            self._peak_injection = np.array(load)
+        if load is self._peak_injection:
+            # the stored array was already converted and checked when it was set
             return
-        raise ValueError
+        if not self._check_input(load):
+            raise ValueError("The peak injection is not valid. Please check the logged error for the cause.")
+        self._peak_injection = self._float_array(load)
 
     def set_peak_injection(self, load: ArrayLike) -> None:
         """
@@ -237,7 +243,7 @@ class MonthlyGeothermalLoadAbsolute(_SingleYear, _LoadData):
             When either the length is not 12, the input is not of the correct type, or it contains negative
             values
         """
-        self.peak_injection = np.array(load)
+        self.peak_injection = load
 
     @property
     def peak_extraction(self) -> np.ndarray:
@@ -272,10 +278,12 @@ class MonthlyGeothermalLoadAbsolute(_SingleYear, _LoadData):
             When either the length is not 12, the input is not of the correct type, or it contains negative
             values
         """
-        if self._check_input(load):
-            self._peak_extraction = np.array(load)
+        if load is self._peak_extraction:
+            # the stored array was already converted and checked when it was set
             return
-        raise ValueError
+        if not self._check_input(load):
+            raise ValueError("The peak extraction is not valid. Please check the logged error for the cause.")
+        self._peak_extraction = self._float_array(load)
 
     def set_peak_extraction(self, load: ArrayLike) -> None:
         """
@@ -297,7 +305,7 @@ class MonthlyGeothermalLoadAbsolute(_SingleYear, _LoadData):
             When either the length is not 12, the input is not of the correct type, or it contains negative
             values
         """
-        self.peak_extraction = np.array(load)
+        self.peak_extraction = load
 
     @property
     def monthly_baseload_injection_simulation_period(self) -> np.ndarray:
@@ -426,6 +434,22 @@ class MonthlyGeothermalLoadAbsolute(_SingleYear, _LoadData):
 
         raise TypeError("Cannot perform addition. Please check if you use correct classes.")
 
+    @staticmethod
+    def _float_array(load: ArrayLike) -> np.ndarray:
+        """
+        This function converts the load to a contiguous float64 array.
+
+        Parameters
+        ----------
+        load : np.ndarray, list or tuple
+            Load array
+
+        Returns
+        -------
+        load : np.ndarray
+        """
+        return np.array(load, dtype=np.float64)
+
     def correct_for_start_month(self, array: np.ndarray) -> np.ndarray:
         """
         This function corrects the load for the correct start month.
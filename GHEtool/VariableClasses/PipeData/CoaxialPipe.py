@@ -12,7 +12,7 @@ class CoaxialPipe(_PipeData):
     Contains information regarding the Coaxial pipe class.
     """
 
-    __slots__ = 'r_in_in', 'r_in_out', 'r_out_in', 'r_out_out', 'k_g', 'is_inner_inlet', 'R_ff', 'R_fp', 'k_p_out'
+    __slots__ = 'r_in_in', 'r_in_out', 'r_out_in', 'r_out_out', 'is_inner_inlet', 'R_ff', 'R_fp', 'k_p_out'
 
     def __init__(self, r_in_in: float = None, r_in_out: float = None,
                  r_out_in: float = None, r_out_out: float = None, k_p: float = None, k_g: float = None,
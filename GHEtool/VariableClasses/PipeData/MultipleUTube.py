@@ -14,7 +14,7 @@ class MultipleUTube(_PipeData):
     Contains information regarding the Multiple U-Tube class.
     """
 
-    __slots__ = _PipeData.__slots__ + ('r_in', 'r_out', 'D_s', 'number_of_pipes', 'pos', 'R_p', 'R_f')
+    __slots__ = 'r_in', 'r_out', 'D_s', 'number_of_pipes', 'pos', 'R_p', 'R_f'
 
     def __init__(self, k_g: float = None,
                  r_in: float = None,
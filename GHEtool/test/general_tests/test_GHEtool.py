@@ -25,20 +25,25 @@ pipeData = DoubleUTube(1, 0.015, 0.02, 0.4, 0.05)
 borefield_gt = gt.boreholes.rectangle_field(10, 12, 6, 6, 110, 4, 0.075)
 
 # Monthly loading values
-peak_injection = [0., 0, 34., 69., 133., 187., 213., 240., 160., 37., 0., 0.]  # Peak cooling in kW
-peak_extraction = [160., 142, 102., 55., 0., 0., 0., 0., 40.4, 85., 119., 136.]  # Peak heating in kW
+peak_injection = np.array([0., 0, 34., 69., 133., 187., 213., 240., 160., 37., 0., 0.], dtype=np.float64)  # Peak cooling in kW
+peak_extraction = np.array([160., 142, 102., 55., 0., 0., 0., 0., 40.4, 85., 119., 136.], dtype=np.float64)  # Peak heating in kW
 
 # annual heating and cooling load
 annualHeatingLoad = 300 * 10 ** 3  # kWh
 annualCoolingLoad = 160 * 10 ** 3  # kWh
 
 # percentage of annual load per month (15.5% for January ...)
-baseload_extractionPercentage = [0.155, 0.148, 0.125, .099, .064, 0., 0., 0., 0.061, 0.087, 0.117, 0.144]
-baseload_injectionPercentage = [0.025, 0.05, 0.05, .05, .075, .1, .2, .2, .1, .075, .05, .025]
+baseload_extractionPercentage = np.array([0.155, 0.148, 0.125, .099, .064, 0., 0., 0., 0.061, 0.087, 0.117, 0.144],
+                                         dtype=np.float64)
+baseload_injectionPercentage = np.array([0.025, 0.05, 0.05, .05, .075, .1, .2, .2, .1, .075, .05, .025], dtype=np.float64)
 
 # resulting load per month
-baseload_extraction = list(map(lambda x: x * annualHeatingLoad, baseload_extractionPercentage))  # kWh
-baseload_injection = list(map(lambda x: x * annualCoolingLoad, baseload_injectionPercentage))  # kWh
+baseload_extraction = baseload_extractionPercentage * annualHeatingLoad  # kWh
+baseload_injection = baseload_injectionPercentage * annualCoolingLoad  # kWh
+
+# the module level loads are shared by all tests, so they are made read-only
+for _load in (peak_injection, peak_extraction, baseload_extraction, baseload_injection):
+    _load.setflags(write=False)
 
 custom_field = gt.boreholes.L_shaped_field(N_1=4, N_2=5, B_1=5., B_2=5., H=100., D=4, r_b=0.05)
 
@@ -127,7 +132,7 @@ def borefield_cooling_dom():
                           baseload_extraction=baseload_extraction,
                           baseload_injection=baseload_injection)
 
-    borefield.load.baseload_injection = np.array(baseload_injection) * 2
+    borefield.load.baseload_injection = baseload_injection * 2
 
     borefield.set_ground_parameters(data)
     borefield.set_Rb(0.2)
@@ -154,7 +159,7 @@ def test_sizing_L3_threshold_depth_error(borefield):
 
 def test_sizing_L32(borefield_cooling_dom):
     borefield_cooling_dom.size(L3_sizing=True)
-    borefield_cooling_dom.load.peak_extraction = np.array(peak_extraction) * 5
+    borefield_cooling_dom.load.peak_extraction = peak_extraction * 5
     borefield_cooling_dom.size(L3_sizing=True)
 
 
@@ -179,12 +184,12 @@ def test_choose_quadrant_None(borefield_quadrants):
 
 
 @pytest.mark.slow
-def test_load_custom_gfunction(borefield):
+def test_load_custom_gfunction(borefield, tmp_path):
     borefield.create_custom_dataset()
-    borefield.custom_gfunction.dump_custom_dataset("./", "test")
+    borefield.custom_gfunction.dump_custom_dataset(f"{tmp_path}/", "test")
     dataset = copy.copy(borefield.custom_gfunction)
 
-    borefield.load_custom_gfunction("./test.gvalues")
+    borefield.load_custom_gfunction(tmp_path / "test.gvalues")
     assert borefield.custom_gfunction == dataset
 
 
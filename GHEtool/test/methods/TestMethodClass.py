@@ -125,7 +125,7 @@ class TestMethodClass():
             if not isinstance(i, SizingObject):
                 continue
             if i.L2_output is not None or i.error_L2 is not None:
-                temp.append(copy.deepcopy(i.borefield))
+                temp.append(i.borefield)
         return temp
 
     @property
@@ -145,7 +145,7 @@ class TestMethodClass():
             if not isinstance(i, SizingObject):
                 continue
             if i.L3_output is not None or i.error_L3 is not None:
-                temp.append(copy.deepcopy(i.borefield))
+                temp.append(i.borefield)
         return temp
 
     @property
@@ -165,7 +165,7 @@ class TestMethodClass():
             if not isinstance(i, SizingObject):
                 continue
             if i.L4_output is not None or i.error_L4 is not None:
-                temp.append(copy.deepcopy(i.borefield))
+                temp.append(i.borefield)
         return temp
 
     @property
@@ -184,7 +184,7 @@ class TestMethodClass():
         for _, i in enumerate(self.list_of_test_objects):
             if isinstance(i, SizingObject):
                 continue
-            temp.append((copy.deepcopy(i.borefield), copy.deepcopy(i.load), i.depth, i.power, i.hourly,
+            temp.append((i.borefield, i.load, i.depth, i.power, i.hourly,
                          i.max_peak_heating, i.max_peak_cooling))
         return temp
 
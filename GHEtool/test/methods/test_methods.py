@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 import numpy as np
 from GHEtool import Borefield
@@ -9,6 +11,8 @@ from GHEtool.Methods import *
                          zip(list_of_test_objects.L2_sizing_input, list_of_test_objects.L2_sizing_output),
                          ids=list_of_test_objects.names_L2)
 def test_L2(model: Borefield, result):
+    # the parametrized models are shared templates, so every test sizes its own copy
+    model = copy.deepcopy(model)
     if not isinstance(result[0], (int, float, str)):
         with pytest.raises(result[0]):
             model.size_L2(100)
@@ -21,6 +25,8 @@ def test_L2(model: Borefield, result):
                          zip(list_of_test_objects.L3_sizing_input, list_of_test_objects.L3_sizing_output),
                          ids=list_of_test_objects.names_L3)
 def test_L3(model: Borefield, result):
+    # the parametrized models are shared templates, so every test sizes its own copy
+    model = copy.deepcopy(model)
     if not isinstance(result[0], (int, float, str)):
         with pytest.raises(result[0]):
             model.size_L3(100)
@@ -33,6 +39,8 @@ def test_L3(model: Borefield, result):
                          zip(list_of_test_objects.L4_sizing_input, list_of_test_objects.L4_sizing_output),
                          ids=list_of_test_objects.names_L4)
 def test_L4(model: Borefield, result):
+    # the parametrized models are shared templates, so every test sizes its own copy
+    model = copy.deepcopy(model)
     if not isinstance(result[0], (int, float, str)):
         with pytest.raises(result[0]):
             model.size_L4(100)
@@ -46,8 +54,10 @@ def test_L4(model: Borefield, result):
                              list_of_test_objects.optimise_load_profile_output),
                          ids=list_of_test_objects.names_optimise_load_profile)
 def test_optimise(input, result):
-    model: Borefield = input[0]
-    load, depth, power, hourly, max_peak_extraction, max_peak_injection = input[1:]
+    # the parametrized borefield and load are shared templates, so they are only copied for the selected tests
+    model: Borefield = copy.deepcopy(input[0])
+    load = copy.deepcopy(input[1])
+    depth, power, hourly, max_peak_extraction, max_peak_injection = input[2:]
     if power:
         borefield_load, external_load = optimise_load_profile_power(model, load,
                                                                     depth,
@@ -67,8 +67,9 @@ def test_create_dataset():
     assert not np.any(custom_gfunction.gvalues_array)
 
 
-def test_dump_dataset(custom_gfunction):
-    custom_gfunction.dump_custom_dataset("", "test")
+def test_dump_dataset(custom_gfunction, tmp_path):
+    custom_gfunction.dump_custom_dataset(f"{tmp_path}/", "test")
+    assert (tmp_path / "test.gvalues").exists()
 
 
 def test_set_options():
@@ -77,8 +78,9 @@ def test_set_options():
     assert custom_gfunction.options["method"] == "equivalentt"
 
 
-def test_load_custom_gfunction():
-    assert isinstance(load_custom_gfunction("test.gvalues"), CustomGFunction)
+def test_load_custom_gfunction(custom_gfunction, tmp_path):
+    custom_gfunction.dump_custom_dataset(f"{tmp_path}/", "test")
+    assert isinstance(load_custom_gfunction(tmp_path / "test.gvalues"), CustomGFunction)
 
 
 def test_check():
@@ -129,10 +131,11 @@ def test_within_range(custom_gfunction):
     assert not custom_gfunction.within_range(time_array, 50)
 
 
-def test_gfunction_calculation(custom_gfunction):
+def test_gfunction_calculation(custom_gfunction, tmp_path):
     assert np.isclose(0.03586207, custom_gfunction.calculate_gfunction(4000, 100, True)[0])
     assert np.allclose(np.array([0.03586207, 0.1343308]), custom_gfunction.calculate_gfunction([4000, 8000], 100, True))
     # test with loading
-    loaded_custom_gfunction = load_custom_gfunction("test.gvalues")
+    custom_gfunction.dump_custom_dataset(f"{tmp_path}/", "test")
+    loaded_custom_gfunction = load_custom_gfunction(tmp_path / "test.gvalues")
     assert np.isclose(0.03586207, loaded_custom_gfunction.calculate_gfunction(4000, 100, True)[0])
     assert np.allclose(np.array([0.03586207, 0.1343308]), loaded_custom_gfunction.calculate_gfunction([4000, 8000], 100, True))
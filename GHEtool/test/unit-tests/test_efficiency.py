@@ -7,6 +7,15 @@ import numpy as np
 
 from GHEtool.VariableClasses.Efficiency import *
 
+# datasets with secondary temperature and part load, shared by the COP and EER tests
+data_full = np.array([1, 2, 2, 4, 2, 4, 4, 8])
+coordinates_full = np.array([[1.5, 2.5, 4.5], [2.5, 2.5, 4.5], [1.5, 4.5, 4.5], [2.5, 4.5, 4.5],
+                             [1.5, 2.5, 8.5], [2.5, 2.5, 8.5], [1.5, 4.5, 8.5], [2.5, 4.5, 8.5]])
+coordinates_seasonal = np.array([[1.5, 2.5, 0], [2.5, 2.5, 0], [1.5, 4.5, 0], [2.5, 4.5, 0],
+                                 [1.5, 2.5, 10], [2.5, 2.5, 10], [1.5, 4.5, 10], [2.5, 4.5, 10]])
+for _array in (data_full, coordinates_full, coordinates_seasonal):
+    _array.setflags(write=False)
+
 
 def test_SCOP():
     scop = SCOP(50)
@@ -91,38 +100,36 @@ def test_COP_part_load():
     assert np.array_equal(cop_part.get_COP(1.5, power=np.array([2.5, 4.5])), np.array([1, 2]))
 
 
-def test_COP_full():
-    cop_full = COP(np.array([1, 2, 2, 4, 2, 4, 4, 8]),
-                   np.array([[1.5, 2.5, 4.5], [2.5, 2.5, 4.5], [1.5, 4.5, 4.5], [2.5, 4.5, 4.5],
-                             [1.5, 2.5, 8.5], [2.5, 2.5, 8.5], [1.5, 4.5, 8.5], [2.5, 4.5, 8.5]]),
-                   secondary=True, part_load=True)
+@pytest.mark.parametrize("efficiency_class,getter", [(COP, "get_COP"), (EER, "get_EER")])
+def test_full(efficiency_class, getter):
+    efficiency_full = efficiency_class(data_full, coordinates_full, secondary=True, part_load=True)
+    get_efficiency = getattr(efficiency_full, getter)
 
-    assert cop_full._has_part_load
-    assert cop_full._has_secondary
+    assert efficiency_full._has_part_load
+    assert efficiency_full._has_secondary
 
     with pytest.raises(ValueError):
-        assert cop_full.get_COP(5, 3) == 3
+        assert get_efficiency(5, 3) == 3
 
-    assert cop_full.get_COP(2, 2.5, 4.5) == 1.5
-    assert np.array_equal(cop_full.get_COP(np.array([2, 2.5]), np.array([3.5, 3.5]), np.array([6.5, 8])),
+    assert get_efficiency(2, 2.5, 4.5) == 1.5
+    assert np.array_equal(get_efficiency(np.array([2, 2.5]), np.array([3.5, 3.5]), np.array([6.5, 8])),
                           np.array([3.375, 5.625]))
-    assert np.array_equal(cop_full.get_COP(np.array([2, 2.5, 5]), np.array([3.5, 3.5, 3.5]), np.array([6.5, 8, 8])),
+    assert np.array_equal(get_efficiency(np.array([2, 2.5, 5]), np.array([3.5, 3.5, 3.5]), np.array([6.5, 8, 8])),
                           np.array([3.375, 5.625, 5.625]))
-    assert np.array_equal(cop_full.get_COP(1.5, secondary_temperature=np.array([2.5, 4.5]), power=4.5),
+    assert np.array_equal(get_efficiency(1.5, secondary_temperature=np.array([2.5, 4.5]), power=4.5),
                           np.array([1, 2]))
 
 
-def test_COP_get_SCOP():
-    cop_full = COP(np.array([1, 2, 2, 4, 2, 4, 4, 8]),
-                   np.array([[1.5, 2.5, 0], [2.5, 2.5, 0], [1.5, 4.5, 0], [2.5, 4.5, 0],
-                             [1.5, 2.5, 10], [2.5, 2.5, 10], [1.5, 4.5, 10], [2.5, 4.5, 10]]),
-                   secondary=True, part_load=True)
+@pytest.mark.parametrize("efficiency_class,getter", [(COP, "get_SCOP"), (EER, "get_SEER")])
+def test_seasonal_efficiency(efficiency_class, getter):
+    efficiency_full = efficiency_class(data_full, coordinates_seasonal, secondary=True, part_load=True)
+    get_seasonal_efficiency = getattr(efficiency_full, getter)
 
     with pytest.raises(ValueError):
-        cop_full.get_SCOP([10, 5], [2, 3, 4])
+        get_seasonal_efficiency([10, 5], [2, 3, 4])
 
-    assert np.isclose(cop_full.get_SCOP([10, 10], [1.5, 2.5], [2.5, 2.5]), 16 / 6)
-    assert np.isclose(cop_full.get_SCOP([10, 5], [1.5, 2.5], [2.5, 2.5]), 45 / 20)
+    assert np.isclose(get_seasonal_efficiency([10, 10], [1.5, 2.5], [2.5, 2.5]), 16 / 6)
+    assert np.isclose(get_seasonal_efficiency([10, 5], [1.5, 2.5], [2.5, 2.5]), 45 / 20)
 
 
 def test_error_EER():
@@ -192,39 +199,6 @@ def test_EER_part_load():
     assert np.array_equal(eer_part.get_EER(1.5, power=np.array([2.5, 4.5])), np.array([1, 2]))
 
 
-def test_EER_full():
-    eer_full = EER(np.array([1, 2, 2, 4, 2, 4, 4, 8]),
-                   np.array([[1.5, 2.5, 4.5], [2.5, 2.5, 4.5], [1.5, 4.5, 4.5], [2.5, 4.5, 4.5],
-                             [1.5, 2.5, 8.5], [2.5, 2.5, 8.5], [1.5, 4.5, 8.5], [2.5, 4.5, 8.5]]),
-                   secondary=True, part_load=True)
-    assert eer_full._has_part_load
-    assert eer_full._has_secondary
-
-    with pytest.raises(ValueError):
-        assert eer_full.get_EER(5, 3) == 3
-
-    assert eer_full.get_EER(2, 2.5, 4.5) == 1.5
-    assert np.array_equal(eer_full.get_EER(np.array([2, 2.5]), np.array([3.5, 3.5]), np.array([6.5, 8])),
-                          np.array([3.375, 5.625]))
-    assert np.array_equal(eer_full.get_EER(np.array([2, 2.5, 5]), np.array([3.5, 3.5, 3.5]), np.array([6.5, 8, 8])),
-                          np.array([3.375, 5.625, 5.625]))
-    assert np.array_equal(eer_full.get_EER(1.5, secondary_temperature=np.array([2.5, 4.5]), power=4.5),
-                          np.array([1, 2]))
-
-
-def test_EER_get_SEER():
-    eer_full = EER(np.array([1, 2, 2, 4, 2, 4, 4, 8]),
-                   np.array([[1.5, 2.5, 0], [2.5, 2.5, 0], [1.5, 4.5, 0], [2.5, 4.5, 0],
-                             [1.5, 2.5, 10], [2.5, 2.5, 10], [1.5, 4.5, 10], [2.5, 4.5, 10]]),
-                   secondary=True, part_load=True)
-
-    with pytest.raises(ValueError):
-        eer_full.get_SEER([10, 5], [2, 3, 4])
-
-    assert np.isclose(eer_full.get_SEER([10, 10], [1.5, 2.5], [2.5, 2.5]), 16 / 6)
-    assert np.isclose(eer_full.get_SEER([10, 5], [1.5, 2.5], [2.5, 2.5]), 45 / 20)
-
-
 def test_eq():
     scop1 = SCOP(5)
     scop2 = SCOP(6)
@@ -267,6 +241,14 @@ def test_eq():
     assert eer_pl1 == eer_pl3
 
 
+def test_eq_different_range_lengths():
+    cop1 = COP(np.array([1, 2, 2, 3, 4, 5]), np.array([[1, 1], [1, 3], [2, 1], [2, 3], [3, 1], [3, 3]]), part_load=True)
+    cop2 = COP(np.array([1, 2, 2, 3, 4, 5]), np.array([[1, 1], [1, 3], [2, 1], [2, 3], [3, 1], [3, 3]]), part_load=True)
+    cop3 = COP(np.array([1, 2, 2, 3]), np.array([[1, 1], [1, 3], [2, 1], [2, 3]]), part_load=True)
+    assert cop1 == cop2
+    assert cop1 != cop3
+
+
 def test_scale_EER():
     with pytest.raises(ValueError):
         eer_full = EER(np.array([1, 2, 2, 4, 2, 4, 4, 8]),
@@ -295,6 +277,16 @@ def test_scale_COP():
     assert np.array_equal(cop_full._points[-1], np.array([0, 1]))
 
 
+def test_float_storage():
+    cop = COP(np.array([1, 2, 2, 4]), np.array([[1, 0], [2, 0], [1, 10], [2, 10]]), part_load=True,
+              nominal_power=1, reference_nominal_power=10)
+    for array in (cop._data, cop._range_primary, cop._range_part_load):
+        assert array.dtype == np.float64
+        assert array.flags.c_contiguous
+    assert np.array_equal(cop._range_part_load, np.array([0, 1]))
+    assert cop._points[-1] is cop._range_part_load
+
+
 def test_interpolation():
     cop = COP(np.array([1, 2, 2, 3]), np.array([[1, 1], [1, 3], [2, 1], [2, 2]]), part_load=True)
     assert np.array_equal(cop._range_part_load, np.array([1, 2, 3]))
@@ -307,6 +299,11 @@ def test_interpolation():
     assert np.array_equal(cop._data, np.array([[[1, 1.5, 2], [1, 1.5, 2]], [[2, 3, 3], [2, 3, 3]]]))
 
 
+def test_duplicate_coordinates():
+    cop = COP(np.array([1, 2, 2, 3, 5]), np.array([[1, 1], [1, 2], [2, 1], [2, 2], [1, 1]]), part_load=True)
+    assert np.array_equal(cop._data, np.array([[1, 2], [2, 3]]))
+
+
 def test_EERCombined():
     with pytest.raises(ValueError):
         EERCombined(20, 5)
@@ -352,6 +349,16 @@ def test_EERCombined():
                       30 / 4.5)
 
 
+def test_hash():
+    cop1 = COP(np.array([1, 10]), np.array([1, 10]))
+    cop2 = COP(np.array([1., 10.]), np.array([1., 10.]))
+    cop3 = COP(np.array([2, 10]), np.array([1, 10]))
+    assert hash(cop1) == hash(cop2)
+    assert len({cop1, cop2, cop3}) == 2
+    with pytest.raises(TypeError):
+        hash(SCOP(5))
+
+
 def test_eq_eer_combined():
     eer_combined = EERCombined(20, 5, 10)
     eer_combined2 = EERCombined(20, 50, 10)
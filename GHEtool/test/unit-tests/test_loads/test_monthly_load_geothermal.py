@@ -90,6 +90,23 @@ def test_peak_injection():
         load.set_peak_injection(np.ones(11))
 
 
+def test_float_loads():
+    load = MonthlyGeothermalLoadAbsolute()
+    load.baseload_extraction = [1] * 12
+    load.peak_extraction = (2, ) * 12
+    assert load._baseload_extraction.dtype == np.float64
+    assert load._peak_extraction.dtype == np.float64
+    stored = load._baseload_extraction
+    load.baseload_extraction = load.baseload_extraction
+    assert load._baseload_extraction is stored
+    # in-place arithmetic works for every start month
+    load.baseload_extraction += 1
+    assert np.array_equal(load.baseload_extraction, np.full(12, 2))
+    load.start_month = 3
+    load.baseload_extraction += 1
+    assert np.array_equal(load.baseload_extraction, np.full(12, 3))
+
+
 def test_times():
     load = MonthlyGeothermalLoadAbsolute()
     load.peak_injection_duration = 6
@@ -186,19 +186,19 @@ def test_create_custom_dataset():
         borefield_test.create_custom_dataset([100, 1000], [50, 100])
 
 
-def test_load_custom_gfunction():
+def test_load_custom_gfunction(tmp_path):
     borefield = Borefield()
     borefield.set_ground_parameters(ground_data_constant)
     borefield.borefield = copy.deepcopy(borefield_gt)
     borefield.create_custom_dataset()
-    borefield.custom_gfunction.dump_custom_dataset("./", "test")
+    borefield.custom_gfunction.dump_custom_dataset(f"{tmp_path}/", "test")
     dataset = copy.copy(borefield.custom_gfunction)
     borefield.borefield = None
     assert borefield.custom_gfunction is None
     borefield.custom_gfunction = dataset
     borefield.set_borefield(None)
     assert borefield.custom_gfunction is None
-    borefield.load_custom_gfunction("./test.gvalues")
+    borefield.load_custom_gfunction(tmp_path / "test.gvalues")
     assert borefield.custom_gfunction == dataset
 
 